@@ -217,7 +217,7 @@ class QQOfficialWebhookPager:
 
         size = self._get_image_size(image_path)
         image_w, image_h = size if size else (1280, 720)
-        image_markdown = self._build_markdown_image(image_url, image_path=image_path)
+        image_markdown = self._build_markdown_image(image_url, size=size)
 
         return await self._send_markdown_keyboard(
             event,
@@ -267,7 +267,7 @@ class QQOfficialWebhookPager:
 
         size = self._get_image_size(image_path)
         image_w, image_h = size if size else (1280, 720)
-        image_markdown = self._build_markdown_image(image_url, image_path=image_path)
+        image_markdown = self._build_markdown_image(image_url, size=size)
 
         return await self._send_markdown_only_image(
             event,
@@ -422,7 +422,7 @@ class QQOfficialWebhookPager:
 
         size = self._get_image_size(image_path)
         image_w, image_h = size if size else (1280, 720)
-        image_markdown = self._build_markdown_image(image_url, image_path=image_path)
+        image_markdown = self._build_markdown_image(image_url, size=size)
 
         return await self._send_markdown_keyboard_for_interaction(
             bot,
@@ -453,12 +453,13 @@ class QQOfficialWebhookPager:
             return None
         return None
 
-    def _build_markdown_image(self, image_url: str, *, image_path: str) -> str:
+    def _build_markdown_image(
+        self, image_url: str, *, size: tuple[int, int] | None
+    ) -> str:
         url = str(image_url or "").strip()
         if not url:
             return ""
 
-        size = self._get_image_size(image_path)
         if not size:
             return f"![result]({url})"
 
@@ -13,6 +13,7 @@ MARKET_PLATFORM_ALIASES: dict[str, str] = {
     "ns": "switch",
     "switch": "switch",
 }
+MARKET_PLATFORM_VALUES: frozenset[str] = frozenset(MARKET_PLATFORM_ALIASES.values())
 
 WORLDSTATE_PLATFORM_ALIASES: dict[str, str] = {
     "pc": "pc",
@@ -30,6 +31,9 @@ WORLDSTATE_PLATFORM_ALIASES: dict[str, str] = {
     "switch": "swi",
     "swi": "swi",
 }
+WORLDSTATE_PLATFORM_VALUES: frozenset[str] = frozenset(
+    WORLDSTATE_PLATFORM_ALIASES.values()
+)
 
 WM_BUY_ALIASES: set[str] = {"收", "买", "buy", "b"}
 WM_SELL_ALIASES: set[str] = {"出", "卖", "sell", "s"}
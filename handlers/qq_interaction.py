@@ -8,6 +8,7 @@ from ..clients.market_client import WarframeMarketClient
 from ..components.event_ttl_cache import EventScopedTTLCache
 from ..components.qq_official_webhook import QQOfficialWebhookPager
 from ..services.market.pager_common import (
+    build_wm_pick_state,
     filter_sort_wm_orders,
     rank_wmr_auctions,
     render_wm_page_image,
@@ -160,6 +161,7 @@ async def handle_qq_interaction_create(
         platform_norm = str(state.get("platform") or "pc")
         order_type = str(state.get("order_type") or "sell")
         language = str(state.get("language") or "zh")
+        mod_rank = state.get("mod_rank")  # int | "max" | None
         if not item or not getattr(item, "slug", None):
             await qq_pager.send_markdown_notice_interaction(
                 bot,
@@ -197,6 +199,7 @@ async def handle_qq_interaction_create(
             orders,
             platform=platform_norm,
             order_type=order_type,
+            mod_rank=mod_rank,
         )
 
         rendered, top = await render_wm_page_image(
@@ -232,18 +235,12 @@ async def handle_qq_interaction_create(
         wm_pick_cache.put_by_origin_sender(
             origin=origin,
             sender_id=sender_id,
-            state={
-                "item_name_en": getattr(item, "name", "") or "",
-                "order_type": order_type,
-                "platform": platform_norm,
-                "rows": [
-                    {
-                        "name": (o.ingame_name or "").strip(),
-                        "platinum": int(o.platinum),
-                    }
-                    for o in top
-                ],
-            },
+            state=build_wm_pick_state(
+                item_name_en=getattr(item, "name", "") or "",
+                order_type=order_type,
+                platform=platform_norm,
+                top=top,
+            ),
         )
 
         ok = await qq_pager.send_result_markdown_with_keyboard_interaction(
@@ -301,6 +298,7 @@ async def handle_qq_interaction_create(
 
         polarity = state.get("polarity")
         polarity = str(polarity).strip().lower() if polarity else None
+        summary_cached = state.get("summary")
         attr_units_raw = state.get("riven_attr_units")
         attr_units = (
             {
@@ -366,6 +364,7 @@ async def handle_qq_interaction_create(
             page=new_page,
             limit=limit,
             attr_units=attr_units,
+            summary=summary_cached if isinstance(summary_cached, str) else None,
         )
 
         if not top:
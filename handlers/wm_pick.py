@@ -5,6 +5,7 @@ from astrbot.api.event import AstrMessageEvent
 from astrbot.api.message_components import Reply
 
 from ..components.event_ttl_cache import EventScopedTTLCache
+from ..services.market.pager_common import WMPickRow
 
 
 async def handle_wm_pick_number(
@@ -46,13 +47,12 @@ async def handle_wm_pick_number(
         return
 
     row = rows[idx - 1]
-    if not isinstance(row, dict):
+    if not isinstance(row, WMPickRow):
         return
 
-    row_name = row.get("name")
-    name = row_name.strip() if isinstance(row_name, str) else ""
-    platinum = row.get("platinum")
-    if not name or not isinstance(platinum, int):
+    name = row.name
+    platinum = row.platinum
+    if not name:
         return
 
     item_name_en = (
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 
 
 def split_tokens(text: str) -> list[str]:
@@ -33,16 +33,10 @@ def presence_rank(status: str | None) -> int:
     return 3
 
 
-def uniq_lower(seq: list[str]) -> list[str]:
-    out: list[str] = []
-    seen: set[str] = set()
-    for item in seq:
-        norm = str(item).strip().lower()
-        if not norm or norm in seen:
-            continue
-        seen.add(norm)
-        out.append(norm)
-    return out
+def uniq_lower(seq: Iterable[str]) -> list[str]:
+    out = dict.fromkeys(str(item).strip().lower() for item in seq)
+    out.pop("", None)
+    return list(out)
 
 
 def eta_key_zh(eta_text: str) -> int:
@@ -9,8 +9,14 @@ import aiohttp
 
 from astrbot.api import logger
 
+try:
+    import orjson
+except ImportError:  # optional: faster decoding of large export payloads
+    orjson = None
+
 _proxy_url: str | None = None
 _direct_domains: list[str] = []
+_shared_session: aiohttp.ClientSession | None = None
 
 
 def set_proxy_url(proxy_url: str | None) -> None:
@@ -121,6 +127,34 @@ def _default_headers() -> dict[str, str]:
     }
 
 
+def _get_shared_session() -> aiohttp.ClientSession:
+    """Return the plugin-wide pooled session, creating it on first use.
+
+    Reusing one session keeps TCP/TLS connections alive between requests,
+    e.g. the avatar/thumbnail downloads of a single render that all hit the
+    same static host.
+    """
+
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=16,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+        _shared_session = aiohttp.ClientSession(connector=connector, trust_env=True)
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    global _shared_session
+    session = _shared_session
+    _shared_session = None
+    if session is not None and not session.closed:
+        await session.close()
+
+
 async def fetch_bytes(
     urls: str | list[str],
     *,
@@ -134,23 +168,25 @@ async def fetch_bytes(
     req_headers = {**_default_headers(), **(headers or {})}
     timeout = aiohttp.ClientTimeout(total=float(timeout_sec))
 
-    async with aiohttp.ClientSession(timeout=timeout, trust_env=True) as session:
-        last_err: str | None = None
-        for url in url_list:
-            try:
-                req_kw = request_kwargs_for_url(url)
-                async with session.get(url, headers=req_headers, **req_kw) as resp:
-                    if resp.status != 200:
-                        last_err = f"{resp.status} {url}"
-                        continue
-                    return await resp.read()
-            except Exception as exc:
-                last_err = f"{exc!s} ({url})"
-                continue
-
-        if last_err:
-            logger.warning(f"http fetch_bytes failed: {last_err}")
-        return None
+    session = _get_shared_session()
+    last_err: str | None = None
+    for url in url_list:
+        try:
+            req_kw = request_kwargs_for_url(url)
+            async with session.get(
+                url, headers=req_headers, timeout=timeout, **req_kw
+            ) as resp:
+                if resp.status != 200:
+                    last_err = f"{resp.status} {url}"
+                    continue
+                return await resp.read()
+        except Exception as exc:
+            last_err = f"{exc!s} ({url})"
+            continue
+
+    if last_err:
+        logger.warning(f"http fetch_bytes failed: {last_err}")
+    return None
 
 
 async def fetch_json(
@@ -162,6 +198,11 @@ async def fetch_json(
     raw = await fetch_bytes(urls, timeout_sec=timeout_sec, headers=headers)
     if raw is None:
         return None
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. invalid UTF-8; retry with the lenient decode below
     try:
         return json.loads(raw.decode("utf-8", "replace"))
     except Exception as exc:
@@ -21,12 +21,15 @@ from .components.qq_official_webhook import QQOfficialWebhookPager
 from .handlers.qq_interaction import handle_qq_interaction_create
 from .handlers.wm_pick import handle_wm_pick_number
 from .helpers import split_tokens
-from .http_utils import set_direct_domains, set_proxy_url
+from .http_utils import close_shared_session, set_direct_domains, set_proxy_url
 from .mappers.riven_mapping import WarframeRivenWeaponMapper
 from .mappers.riven_stats_mapping import WarframeRivenStatMapper
 from .mappers.term_mapping import WarframeTermMapper
 from .renderers.html_snapshot import (
+    clear_asset_cache,
+    close_html_renderer,
     configure_image_cache,
+    configure_render_output,
     start_playwright_runtime_prepare,
 )
 from .renderers.template_loader import (
@@ -205,6 +208,20 @@ def _parse_image_cache_config(config: dict | None) -> str:
     return cache_dir
 
 
+def _parse_render_jpeg_quality(config: dict | None) -> int | None:
+    """None keeps the env default; 0 forces PNG; 1-100 selects JPEG."""
+    cfg = config or {}
+    try:
+        quality = int(cfg.get("render_jpeg_quality") or 0)
+    except (TypeError, ValueError):
+        return None
+    if quality == 0:
+        return None
+    if quality < 0:
+        return 0
+    return min(100, quality)
+
+
 def _convert_wm_args_to_wmr(raw_args: str) -> str | None:
     tokens = split_tokens(str(raw_args or "").strip())
     if not tokens:
@@ -259,11 +276,13 @@ def _clear_plugin_image_cache() -> dict[str, int | str]:
             return False
         if n == "wf_helper_blank_1x1.png":
             return True
-        if n.startswith("wf_worldstate_") and n.endswith(".png"):
+        if not n.endswith((".png", ".jpg")):
+            return False
+        if n.startswith("wf_worldstate_"):
             return True
-        if n.startswith("wmr_") and n.endswith(".png"):
+        if n.startswith("wmr_"):
             return True
-        if n.startswith("wm_") and n.endswith(".png"):
+        if n.startswith("wm_"):
             return True
         return False
 
@@ -278,6 +297,10 @@ def _clear_plugin_image_cache() -> dict[str, int | str]:
         except Exception:
             failed += 1
 
+    asset_removed, asset_failed = clear_asset_cache()
+    removed += asset_removed
+    failed += asset_failed
+
     return {"removed": removed, "failed": failed, "message": "ok"}
 
 
@@ -392,6 +415,9 @@ class WarframeHelperPlugin(Star):
         configure_image_cache(
             cache_dir=image_cache_dir,
         )
+        configure_render_output(
+            jpeg_quality=_parse_render_jpeg_quality(self.config),
+        )
 
         _apply_proxy_config(self.config)
 
@@ -496,6 +522,8 @@ class WarframeHelperPlugin(Star):
     async def terminate(self):
         """可选择实现异步的插件销毁方法，当插件被卸载/停用时会调用。"""
         await self._subscriptions.stop()
+        await close_shared_session()
+        await close_html_renderer()
 
     async def _on_qq_interaction_create(self, bot: object, interaction: object) -> None:
         self._debug_log(
@@ -587,11 +615,14 @@ class WarframeHelperPlugin(Star):
             return
 
         filename = path.name.lower()
-        is_plugin_generated = (
-            filename == "wf_helper_blank_1x1.png"
-            or (filename.startswith("wf_worldstate_") and filename.endswith(".png"))
-            or (filename.startswith("wm_") and filename.endswith(".png"))
-            or (filename.startswith("wmr_") and filename.endswith(".png"))
+        is_rendered_image = filename.endswith((".png", ".jpg"))
+        is_plugin_generated = filename == "wf_helper_blank_1x1.png" or (
+            is_rendered_image
+            and (
+                filename.startswith("wf_worldstate_")
+                or filename.startswith("wm_")
+                or filename.startswith("wmr_")
+            )
         )
         if not is_plugin_generated:
             return
@@ -99,6 +99,7 @@ class WarframeRivenStatMapper:
         self._stats_by_name: dict[str, list[RivenStat]] = {}
         self._stats_tokens: dict[str, set[str]] = {}
         self._compound_keys: list[str] = []
+        self._compound_keys_by_head: dict[str, list[str]] = {}
         self._debug_logging_enabled = False
 
     def set_debug_logging_enabled(self, enabled: bool) -> None:
@@ -129,6 +130,9 @@ class WarframeRivenStatMapper:
             key=len,
             reverse=True,
         )
+        self._compound_keys_by_head = {}
+        for k in self._compound_keys:
+            self._compound_keys_by_head.setdefault(k[0], []).append(k)
         self._debug_log(
             "reload_aliases",
             aliases=len(self._alias_full_names),
@@ -483,7 +487,7 @@ class WarframeRivenStatMapper:
         i = 0
         while i < len(norm):
             matched: str | None = None
-            for key in self._compound_keys:
+            for key in self._compound_keys_by_head.get(norm[i], ()):
                 if norm.startswith(key, i):
                     matched = key
                     break
@@ -2,18 +2,23 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import hashlib
 import mimetypes
 import os
 import platform
 import shutil
 import sys
+import time
 import uuid
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 from astrbot.api import logger
 from astrbot.core.utils.astrbot_path import get_astrbot_temp_path
 
+from ..http_utils import fetch_bytes
+
 
 def _env_int(name: str, default: int) -> int:
     raw = str(os.environ.get(name) or "").strip()
@@ -28,7 +33,18 @@ def _env_int(name: str, default: int) -> int:
 _HTML_RENDER_CONNECT_TIMEOUT_SEC = max(1, _env_int("WF_HTML_RENDER_CONNECT_TIMEOUT", 4))
 _HTML_RENDER_LAUNCH_TIMEOUT_SEC = max(2, _env_int("WF_HTML_RENDER_LAUNCH_TIMEOUT", 8))
 _HTML_RENDER_PAGE_TIMEOUT_SEC = max(2, _env_int("WF_HTML_RENDER_PAGE_TIMEOUT", 6))
+# 0 keeps PNG output; 1-100 switches screenshots to JPEG at that quality.
+_HTML_RENDER_JPEG_QUALITY = max(0, min(100, _env_int("WF_HTML_RENDER_JPEG_QUALITY", 0)))
 _IMAGE_CACHE_DIR_OVERRIDE = ""
+_ASSET_CACHE_DIRNAME = "wm_asset_cache"
+_ASSET_CACHE_TTL_SEC = 7 * 24 * 3600
+_ASSET_CACHE_SWEEP_INTERVAL_SEC = 6 * 3600
+_ASSET_CACHE_LAST_SWEEP = 0.0
+_ASSET_DOWNLOAD_CONCURRENCY = 8
+_ASSET_REQUEST_HEADERS = {
+    "User-Agent": "AstrBot/warframe_helper (+https://github.com/Soulter/AstrBot)",
+    "Accept": "image/*,*/*;q=0.8",
+}
 
 _PLAYWRIGHT_INSTALL_LOCK = asyncio.Lock()
 _PLAYWRIGHT_INSTALL_DONE = False
@@ -39,7 +55,9 @@ _PLAYWRIGHT_PREPARING_SKIP_LOGGED = False
 class _PlaywrightRuntime:
     def __init__(self) -> None:
         self._playwright = None
+        self._browser = None
         self._lock = asyncio.Lock()
+        self._browser_lock = asyncio.Lock()
 
     async def get(self):
         async with self._lock:
@@ -58,6 +76,48 @@ class _PlaywrightRuntime:
                 logger.warning(f"playwright startup failed: {exc!s}")
                 return None
 
+    async def get_browser(self, launch_kwargs: Callable[[], dict[str, Any]]):
+        """Return a shared browser, launching it only when none is alive.
+
+        Launching Chromium dominates render latency, so renders open a new
+        page on one long-lived browser instead of a browser each.
+        """
+
+        async with self._browser_lock:
+            browser = self._browser
+            if browser is not None and browser.is_connected():
+                return browser
+
+            runtime = await self.get()
+            if runtime is None:
+                return None
+
+            self._browser = await runtime.chromium.launch(**launch_kwargs())
+            return self._browser
+
+    async def discard_browser(self, browser) -> None:
+        async with self._browser_lock:
+            if self._browser is browser:
+                self._browser = None
+        try:
+            await browser.close()
+        except Exception:
+            pass
+
+    async def close(self) -> None:
+        browser = self._browser
+        if browser is not None:
+            await self.discard_browser(browser)
+
+        async with self._lock:
+            playwright = self._playwright
+            self._playwright = None
+            if playwright is not None:
+                try:
+                    await playwright.stop()
+                except Exception:
+                    pass
+
 
 _PLAYWRIGHT_RUNTIME = _PlaywrightRuntime()
 
@@ -72,6 +132,13 @@ def configure_image_cache(
         _IMAGE_CACHE_DIR_OVERRIDE = str(cache_dir or "").strip()
 
 
+def configure_render_output(*, jpeg_quality: int | None = None) -> None:
+    global _HTML_RENDER_JPEG_QUALITY
+
+    if jpeg_quality is not None:
+        _HTML_RENDER_JPEG_QUALITY = max(0, min(100, int(jpeg_quality)))
+
+
 def _get_image_cache_dir() -> Path:
     override = str(_IMAGE_CACHE_DIR_OVERRIDE or "").strip()
     if not override:
@@ -83,6 +150,141 @@ def _get_image_cache_dir() -> Path:
     return path
 
 
+def _asset_cache_dir() -> Path:
+    return _get_image_cache_dir() / _ASSET_CACHE_DIRNAME
+
+
+def _asset_cache_path(url: str) -> Path:
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return _asset_cache_dir() / key[:2] / key
+
+
+def _read_cached_asset(path: Path) -> bytes | None:
+    try:
+        if (time.time() - path.stat().st_mtime) > _ASSET_CACHE_TTL_SEC:
+            return None
+        return path.read_bytes() or None
+    except OSError:
+        return None
+
+
+def _write_cached_asset(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.debug(f"asset cache write failed: {exc!s}")
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _prune_asset_cache() -> None:
+    root = _asset_cache_dir()
+    if not root.is_dir():
+        return
+    cutoff = time.time() - _ASSET_CACHE_TTL_SEC
+    for child in root.glob("*/*"):
+        try:
+            if child.stat().st_mtime < cutoff:
+                child.unlink(missing_ok=True)
+        except OSError:
+            continue
+
+
+def clear_asset_cache() -> tuple[int, int]:
+    """Remove every cached asset; returns (removed, failed) file counts."""
+
+    removed = 0
+    failed = 0
+    root = _asset_cache_dir()
+    if not root.is_dir():
+        return removed, failed
+    for child in root.glob("*/*"):
+        try:
+            child.unlink(missing_ok=True)
+            removed += 1
+        except OSError:
+            failed += 1
+    shutil.rmtree(root, ignore_errors=True)
+    return removed, failed
+
+
+async def fetch_cached_asset_bytes(
+    url: str,
+    *,
+    timeout_sec: float,
+    headers: dict[str, str] | None = None,
+) -> bytes | None:
+    """Download an immutable static asset, keeping a copy on disk.
+
+    warframe.market thumbnails/avatars never change under the same URL, so
+    repeat renders read them locally instead of going over the network.
+    """
+
+    global _ASSET_CACHE_LAST_SWEEP
+
+    path = _asset_cache_path(url)
+    cached = await asyncio.to_thread(_read_cached_asset, path)
+    if cached is not None:
+        return cached
+
+    data = await fetch_bytes(url, timeout_sec=timeout_sec, headers=headers)
+    if data:
+        await asyncio.to_thread(_write_cached_asset, path, data)
+        # Expired entries are only replaced when re-requested; sweep the rest
+        # now and then so avatars of sellers never seen again do not pile up.
+        now = time.time()
+        if now - _ASSET_CACHE_LAST_SWEEP > _ASSET_CACHE_SWEEP_INTERVAL_SEC:
+            _ASSET_CACHE_LAST_SWEEP = now
+            await asyncio.to_thread(_prune_asset_cache)
+    return data
+
+
+async def fetch_asset_data_uris(
+    head_url: str | None,
+    avatar_urls: list[str | None],
+    *,
+    head_filename: str = "image.png",
+    head_timeout_sec: float = 10.0,
+    avatar_timeout_sec: float = 10.0,
+) -> tuple[str | None, dict[str, str]]:
+    """Fetch a header image and row avatars as data URIs.
+
+    Returns ``(head_uri, {avatar_url: uri})``. Each distinct avatar URL is
+    fetched and encoded once; failed downloads are left out of the map.
+    """
+
+    # All assets share one static host; fetch them at once but cap in-flight
+    # requests so a straggler does not hog the pool.
+    sem = asyncio.Semaphore(_ASSET_DOWNLOAD_CONCURRENCY)
+
+    async def dl(url: str | None, *, timeout_sec: float) -> bytes | None:
+        if not url:
+            return None
+        async with sem:
+            return await fetch_cached_asset_bytes(
+                url, timeout_sec=timeout_sec, headers=_ASSET_REQUEST_HEADERS
+            )
+
+    unique_avatar_urls = list(dict.fromkeys(u for u in avatar_urls if u))
+    head_bytes, *avatar_bytes = await asyncio.gather(
+        dl(head_url, timeout_sec=head_timeout_sec),
+        *[dl(u, timeout_sec=avatar_timeout_sec) for u in unique_avatar_urls],
+    )
+
+    avatar_uri_by_url: dict[str, str] = {}
+    for url, data in zip(unique_avatar_urls, avatar_bytes, strict=True):
+        uri = image_bytes_to_data_uri(data)
+        if uri:
+            avatar_uri_by_url[url] = uri
+    head_uri = image_bytes_to_data_uri(head_bytes, filename=head_filename)
+    return head_uri, avatar_uri_by_url
+
+
 async def _run_playwright_cli(
     args: list[str], *, timeout_sec: int, env: dict[str, str] | None = None
 ) -> tuple[int, str]:
@@ -269,6 +471,20 @@ def svg_text_to_data_uri(svg_text: str) -> str:
     return f"data:image/svg+xml;base64,{encoded}"
 
 
+# Shared circular "?" avatar for rows whose avatar is missing.
+PLACEHOLDER_AVATAR_DATA_URI = svg_text_to_data_uri(
+    """
+    <svg xmlns='http://www.w3.org/2000/svg' width='64' height='64' viewBox='0 0 64 64'>
+      <circle cx='32' cy='32' r='32' fill='#e2e8f0'/>
+      <text x='32' y='40' text-anchor='middle' font-size='28' fill='#64748b' font-family='Arial, sans-serif'>?</text>
+    </svg>
+    """.strip()
+)
+
+# Card header background for renders without an item/weapon image.
+HEAD_FALLBACK_STYLE = "background-image: linear-gradient(135deg, rgba(224,231,255,0.92), rgba(219,234,254,0.92));"
+
+
 def _find_browser_executable() -> str | None:
     custom = str(os.environ.get("WF_HTML_RENDER_BROWSER") or "").strip()
     if custom and Path(custom).exists():
@@ -375,9 +591,18 @@ async def _render_page_to_png(
                 "height": max(320, int(content_height or min_height)),
             }
         )
-        await page.screenshot(
-            path=str(out_path), full_page=True, type="png", timeout=timeout_ms
-        )
+        if _HTML_RENDER_JPEG_QUALITY > 0:
+            await page.screenshot(
+                path=str(out_path),
+                full_page=True,
+                type="jpeg",
+                quality=_HTML_RENDER_JPEG_QUALITY,
+                timeout=timeout_ms,
+            )
+        else:
+            await page.screenshot(
+                path=str(out_path), full_page=True, type="png", timeout=timeout_ms
+            )
         return str(out_path)
     except Exception as exc:
         logger.warning(f"Browser render failed: {exc!s}")
@@ -390,22 +615,10 @@ async def _render_page_to_png(
                 pass
 
 
-async def _render_html_to_png_file_impl(
-    *,
-    html: str,
-    width: int,
-    prefix: str,
-    min_height: int = 720,
-) -> str | None:
-    temp_dir = _get_image_cache_dir()
-    temp_dir.mkdir(parents=True, exist_ok=True)
-    out_path = temp_dir / f"{prefix}_{uuid.uuid4().hex}.png"
-
-    runtime = await _PLAYWRIGHT_RUNTIME.get()
-    if runtime is None:
-        return None
-
-    executable_path = _find_browser_executable()
+def _browser_launch_kwargs() -> dict[str, Any]:
+    # Only evaluated when a browser actually has to be launched, so the
+    # PATH/filesystem probing in _find_browser_executable is not paid on
+    # every render.
     launch_args = [
         "--no-sandbox",
         "--disable-setuid-sandbox",
@@ -416,19 +629,35 @@ async def _render_html_to_png_file_impl(
         "--no-first-run",
         "--no-default-browser-check",
     ]
+    kwargs: dict[str, Any] = {
+        "headless": True,
+        "args": launch_args,
+        "timeout": int(float(_HTML_RENDER_LAUNCH_TIMEOUT_SEC) * 1000),
+    }
+    executable_path = _find_browser_executable()
+    if executable_path:
+        kwargs["executable_path"] = executable_path
+    return kwargs
+
+
+async def _render_html_to_png_file_impl(
+    *,
+    html: str,
+    width: int,
+    prefix: str,
+    min_height: int = 720,
+) -> str | None:
+    temp_dir = _get_image_cache_dir()
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    suffix = ".jpg" if _HTML_RENDER_JPEG_QUALITY > 0 else ".png"
+    out_path = temp_dir / f"{prefix}_{uuid.uuid4().hex}{suffix}"
 
     browser = None
     try:
-        launch_timeout_ms = int(float(_HTML_RENDER_LAUNCH_TIMEOUT_SEC) * 1000)
-        kwargs: dict[str, Any] = {
-            "headless": True,
-            "args": launch_args,
-            "timeout": launch_timeout_ms,
-        }
-        if executable_path:
-            kwargs["executable_path"] = executable_path
-
-        browser = await runtime.chromium.launch(**kwargs)
+        browser = await _PLAYWRIGHT_RUNTIME.get_browser(_browser_launch_kwargs)
+        if browser is None:
+            return None
+
         rendered = await _render_page_to_png(
             browser=browser,
             html=html,
@@ -438,18 +667,21 @@ async def _render_html_to_png_file_impl(
         )
         if rendered:
             return rendered
+        # A failed render may leave Chromium hung but still connected; start
+        # the next render on a fresh browser.
+        await _PLAYWRIGHT_RUNTIME.discard_browser(browser)
     except Exception as exc:
         logger.warning(f"Failed to render html snapshot by local playwright: {exc!s}")
-    finally:
         if browser is not None:
-            try:
-                await browser.close()
-            except Exception:
-                pass
+            await _PLAYWRIGHT_RUNTIME.discard_browser(browser)
 
     return None
 
 
+async def close_html_renderer() -> None:
+    await _PLAYWRIGHT_RUNTIME.close()
+
+
 async def render_html_to_png_file(
     *,
     html: str,
@@ -4,13 +4,15 @@ import contextvars
 import re
 from pathlib import Path
 
-from jinja2 import Environment
+from jinja2 import Environment, Template
 
 _TEMPLATE_NAME = "default"
 _VALID_TEMPLATE_RE = re.compile(r"^[A-Za-z0-9_-]+$")
 _CURRENT_COMMAND = contextvars.ContextVar("wf_render_command", default="")
 _CURRENT_TEMPLATE_NAME = contextvars.ContextVar("wf_render_template_name", default="")
 _JINJA_ENV = Environment(autoescape=True)
+# Compiled templates keyed by file path; mtime keeps edited templates fresh.
+_COMPILED_TEMPLATES: dict[str, tuple[int, Template]] = {}
 
 _WORLD_CYCLE_COMMANDS = {
     "平原",
@@ -127,8 +129,11 @@ def get_render_template_name() -> str:
     return _TEMPLATE_NAME
 
 
+_PLUGIN_ROOT = Path(__file__).resolve().parent.parent
+
+
 def _plugin_root() -> Path:
-    return Path(__file__).resolve().parent.parent
+    return _PLUGIN_ROOT
 
 
 def _family_template_filename(command_key: str, filename: str) -> str:
@@ -176,26 +181,43 @@ def _template_file_candidates(
     return out
 
 
+def _compile_template_file(path: Path) -> Template | None:
+    key = str(path)
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _COMPILED_TEMPLATES.get(key)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    tpl = path.read_text(encoding="utf-8")
+    if not tpl:
+        return None
+    template = _JINJA_ENV.from_string(tpl)
+    _COMPILED_TEMPLATES[key] = (mtime_ns, template)
+    return template
+
+
 def load_html_template(
     *,
     filename: str,
     context: dict[str, object],
     template_name: str | None = None,
 ) -> str:
-    tpl = ""
+    tpl_path: Path | None = None
     for path in _template_file_candidates(filename, template_name=template_name):
         try:
-            if path.exists() and path.is_file():
-                tpl = path.read_text(encoding="utf-8")
+            if path.is_file():
+                tpl_path = path
                 break
         except Exception:
             continue
 
-    if not tpl:
+    if tpl_path is None:
         return ""
 
     try:
-        template = _JINJA_ENV.from_string(tpl)
+        template = _compile_template_file(tpl_path)
+        if template is None:
+            return ""
         return str(template.render(**(context or {})))
     except Exception:
         return ""
@@ -1,24 +1,31 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
 from ..clients.market_client import RivenAttribute, RivenAuction
 from ..constants import RIVEN_STAT_CN
-from ..constants import market_status_to_cn, normalize_market_status
-from ..http_utils import fetch_bytes
+from ..constants import MARKET_STATUS_CN, normalize_market_status
 from ..mappers.riven_mapping import RivenWeapon
 from .html_snapshot import (
-    image_bytes_to_data_uri,
+    HEAD_FALLBACK_STYLE,
+    PLACEHOLDER_AVATAR_DATA_URI,
+    fetch_asset_data_uris,
     render_html_to_png_file,
-    svg_text_to_data_uri,
 )
 from .template_loader import load_html_template
 
 WARFRAME_MARKET_ASSETS_BASE_URL = "https://warframe.market/static/assets/"
 
+_HEAD_OVERLAY_GRADIENT = (
+    "linear-gradient(135deg, rgba(224,231,255,0.88), rgba(219,234,254,0.88))"
+)
+
 
-_STAT_CN: dict[str, str] = {
+# Merged once at import and frozen; _fmt_attr_parts only ever reads it.
+_STAT_CN: Mapping[str, str] = MappingProxyType({
     **RIVEN_STAT_CN,
     "attack_speed": "攻速",
     "fire_rate": "射速",
@@ -39,6 +46,14 @@ _STAT_CN: dict[str, str] = {
     "critical_chance_on_slide_attack": "滑攻击暴击率",
     "channeling_efficiency": "引导效率",
     "channeling_damage": "引导伤害",
+})
+
+
+_POLARITY_SHORT: dict[str, str] = {
+    "madurai": "V",
+    "vazarin": "D",
+    "naramon": "-",
+    "zenurik": "R",
 }
 
 
@@ -51,20 +66,9 @@ def _asset_url(asset_path: str) -> str:
     return WARFRAME_MARKET_ASSETS_BASE_URL + asset_path.lstrip("/")
 
 
-async def _download_bytes(url: str, *, timeout_sec: float = 10.0) -> bytes | None:
-    headers = {
-        "User-Agent": "AstrBot/warframe_helper (+https://github.com/Soulter/AstrBot)",
-        "Accept": "image/*,*/*;q=0.8",
-    }
-    return await fetch_bytes(url, timeout_sec=timeout_sec, headers=headers)
-
-
-def _status_class(status: str | None) -> str:
-    s = normalize_market_status(status)
-    if s in {"ingame", "in_game", "in-game", "in game"}:
-        return "ingame"
-    if s == "online":
-        return "online"
+def _status_class(status: str) -> str:
+    if status == "ingame" or status == "online":
+        return status
     return "offline"
 
 
@@ -74,7 +78,6 @@ def _fmt_attr_parts(
     attr_units: dict[str, str] | None = None,
 ) -> tuple[str, str]:
     label = _STAT_CN.get(attr.url_name, attr.url_name)
-    value = float(attr.value)
 
     unit = attr.unit
     if not isinstance(unit, str) or not unit.strip():
@@ -83,7 +86,8 @@ def _fmt_attr_parts(
     unit_norm = (unit or "").strip().lower()
 
     sign = "+" if attr.positive else "-"
-    abs_value = abs(value)
+    # RivenAttribute.value is already coerced to float by the market client.
+    abs_value = abs(attr.value)
 
     if unit_norm == "seconds":
         return label, f"{sign}{abs_value:.1f}s"
@@ -116,27 +120,10 @@ def _fmt_attr_line(
 
 
 def _fmt_polarity(p: str | None) -> str:
-    m = {
-        "madurai": "V",
-        "vazarin": "D",
-        "naramon": "-",
-        "zenurik": "R",
-    }
     p2 = (p or "").strip().lower()
     if not p2:
         return "-"
-    return m.get(p2, p2)
-
-
-def _placeholder_avatar_data_uri() -> str:
-    return svg_text_to_data_uri(
-        """
-        <svg xmlns='http://www.w3.org/2000/svg' width='64' height='64' viewBox='0 0 64 64'>
-          <circle cx='32' cy='32' r='32' fill='#e2e8f0'/>
-          <text x='32' y='40' text-anchor='middle' font-size='28' fill='#64748b' font-family='Arial, sans-serif'>?</text>
-        </svg>
-        """.strip()
-    )
+    return _POLARITY_SHORT.get(p2, p2)
 
 
 def _build_wmr_html(
@@ -147,9 +134,9 @@ def _build_wmr_html(
     rows: list[dict[str, str]],
 ) -> str:
     weapon_background_style = (
-        f"background-image: linear-gradient(135deg, rgba(224,231,255,0.88), rgba(219,234,254,0.88)), url('{weapon_img_uri}');"
+        f"background-image: {_HEAD_OVERLAY_GRADIENT}, url('{weapon_img_uri}');"
         if weapon_img_uri
-        else "background-image: linear-gradient(135deg, rgba(224,231,255,0.92), rgba(219,234,254,0.92));"
+        else HEAD_FALLBACK_STYLE
     )
 
     context: dict[str, object] = {
@@ -188,23 +175,16 @@ async def render_wmr_auctions_image_to_file(
     name = (weapon_display_name or weapon.item_name or "").strip() or weapon.item_name
     title = f"紫卡 {name}（{platform}） 前{limit}"
 
-    weapon_uri: str | None = None
     weapon_asset = weapon.thumb or weapon.icon
-    if weapon_asset:
-        w_bytes = await _download_bytes(_asset_url(weapon_asset))
-        weapon_uri = image_bytes_to_data_uri(w_bytes, filename=weapon_asset)
-
     avatar_urls: list[str | None] = [
         (_asset_url(a.owner_avatar) if a.owner_avatar else None) for a in selected
     ]
 
-    async def fetch_avatar(url: str | None) -> bytes | None:
-        if not url:
-            return None
-        return await _download_bytes(url)
-
-    avatar_bytes_list = await asyncio.gather(*[fetch_avatar(u) for u in avatar_urls])
-    placeholder = _placeholder_avatar_data_uri()
+    weapon_uri, avatar_uri_by_url = await fetch_asset_data_uris(
+        _asset_url(weapon_asset) if weapon_asset else None,
+        avatar_urls,
+        head_filename=weapon_asset or "image.png",
+    )
 
     rows: list[dict[str, str]] = []
     normalized_units: dict[str, str] = {
@@ -213,18 +193,21 @@ async def render_wmr_auctions_image_to_file(
         if isinstance(k, str) and isinstance(v, str) and k.strip() and v.strip()
     }
 
-    for auction, avatar_bytes in zip(selected, avatar_bytes_list, strict=False):
+    for auction, avatar_url in zip(selected, avatar_urls, strict=False):
         owner_name = (auction.owner_name or "unknown").strip() or "unknown"
         status = normalize_market_status(auction.owner_status)
 
-        pos = [x for x in auction.attributes if x.positive]
-        neg = [x for x in auction.attributes if not x.positive]
+        pos: list[RivenAttribute] = []
+        neg: list[RivenAttribute] = []
+        for x in auction.attributes:
+            (pos if x.positive else neg).append(x)
 
         rows.append(
             {
-                "avatar": image_bytes_to_data_uri(avatar_bytes) or placeholder,
+                "avatar": avatar_uri_by_url.get(avatar_url or "")
+                or PLACEHOLDER_AVATAR_DATA_URI,
                 "name": owner_name,
-                "status_text": market_status_to_cn(status),
+                "status_text": MARKET_STATUS_CN.get(status, "未知"),
                 "status_class": _status_class(status),
                 "mr_text": str(int(auction.mastery_level or 0)),
                 "polarity_text": _fmt_polarity(auction.polarity),
@@ -243,7 +226,8 @@ async def render_wmr_auctions_image_to_file(
             }
         )
 
-    html = _build_wmr_html(
+    html = await asyncio.to_thread(
+        _build_wmr_html,
         title=title,
         summary=summary,
         weapon_img_uri=weapon_uri,
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import re
+
 from astrbot.api.event import AstrMessageEvent
 
 from ..clients.drop_data_client import DropDataClient
@@ -7,6 +10,30 @@ from ..clients.public_export_client import PublicExportClient
 from ..helpers import split_tokens
 from ..utils.text import normalize_compact, safe_relic_name
 
+_TRAILING_INT_RE = re.compile(r"\d{1,3}")
+
+_TIER_ALIASES: dict[str, str] = {
+    "lith": "Lith",
+    "meso": "Meso",
+    "neo": "Neo",
+    "axi": "Axi",
+    "requiem": "Requiem",
+    "omnia": "Omnia",
+    "古纪": "Lith",
+    "前纪": "Meso",
+    "中纪": "Neo",
+    "后纪": "Axi",
+    "安魂": "Requiem",
+    "全能": "Omnia",
+}
+
+
+def _to_pct(v: object) -> str:
+    try:
+        return f"{float(v):g}%"
+    except (TypeError, ValueError):
+        return "?%"
+
 
 async def cmd_drops(
     *,
@@ -28,12 +55,9 @@ async def cmd_drops(
         )
 
     limit = 15
-    if tokens and str(tokens[-1]).isdigit():
-        try:
-            limit = int(str(tokens[-1]))
-            tokens = tokens[:-1]
-        except Exception:
-            limit = 15
+    if tokens and _TRAILING_INT_RE.fullmatch(str(tokens[-1])):
+        limit = max(1, min(30, int(tokens[-1])))
+        tokens = tokens[:-1]
 
     query = " ".join([str(t).strip() for t in tokens if str(t).strip()]).strip()
     if not query:
@@ -43,16 +67,39 @@ async def cmd_drops(
 
     resolved_en: str | None = None
 
-    rows = await drop_data_client.search_drops(item_query=query, limit=limit)
-    if not rows:
-        candidates = await public_export_client.resolve_localized_to_english_candidates(
-            query, language="zh", limit=5
+    candidates: list[str] | None = None
+    if query.isascii():
+        rows = await drop_data_client.search_drops(item_query=query, limit=limit)
+    else:
+        # Drop-data names are English, so a localized query almost always
+        # falls through to translation; warm both datasets concurrently.
+        rows, resolved = await asyncio.gather(
+            drop_data_client.search_drops(item_query=query, limit=limit),
+            public_export_client.resolve_localized_to_english_candidates(
+                query, language="zh", limit=5
+            ),
+            return_exceptions=True,
         )
-        if candidates:
-            resolved_en = candidates[0]
+        if isinstance(rows, BaseException):
+            raise rows
+        # Translation is only a fallback; its failure must not discard rows
+        # already found, and is retried below only when there are none.
+        if not isinstance(resolved, BaseException):
+            candidates = resolved
+    if not rows:
+        if candidates is None:
+            candidates = (
+                await public_export_client.resolve_localized_to_english_candidates(
+                    query, language="zh", limit=5
+                )
+            )
+        for candidate in candidates[:3]:
             rows = await drop_data_client.search_drops(
-                item_query=resolved_en, limit=limit
+                item_query=candidate, limit=limit
             )
+            if rows:
+                resolved_en = candidate
+                break
 
     if not rows:
         return event.plain_result(
@@ -60,16 +107,6 @@ async def cmd_drops(
             "提示：该数据源条目多为英文名；也可以尝试更短关键词（如 Neurodes / Blueprint）。"
         )
 
-    def fmt_chance(v: object) -> str:
-        if isinstance(v, (int, float)):
-            return f"{float(v):g}%"
-        if isinstance(v, str):
-            try:
-                return f"{float(v):g}%"
-            except Exception:
-                return "?%"
-        return "?%"
-
     title = f"掉落搜索：{query}"
     if resolved_en:
         title += f"（解析：{resolved_en}）"
@@ -79,7 +116,7 @@ async def cmd_drops(
     for r in rows:
         place = str(r.get("place") or "?")
         rarity = str(r.get("rarity") or "").strip()
-        chance = fmt_chance(r.get("chance"))
+        chance = _to_pct(r.get("chance"))
         suffix = f" | {rarity}" if rarity else ""
         lines.append(f"- {place} | {chance}{suffix}")
 
@@ -106,21 +143,6 @@ async def cmd_relic(
             "示例：/遗物 古纪 A1  或  /遗物 Axi A1  或  /遗物 A1"
         )
 
-    tier_aliases: dict[str, str] = {
-        "lith": "Lith",
-        "meso": "Meso",
-        "neo": "Neo",
-        "axi": "Axi",
-        "requiem": "Requiem",
-        "omnia": "Omnia",
-        "古纪": "Lith",
-        "前纪": "Meso",
-        "中纪": "Neo",
-        "后纪": "Axi",
-        "安魂": "Requiem",
-        "全能": "Omnia",
-    }
-
     tier: str | None = None
     name_parts: list[str] = []
     for t in tokens:
@@ -128,7 +150,7 @@ async def cmd_relic(
         if not raw:
             continue
         k = normalize_compact(raw)
-        guess = tier_aliases.get(k)
+        guess = _TIER_ALIASES.get(k)
         if guess and tier is None:
             tier = guess
             continue
@@ -169,16 +191,7 @@ async def cmd_relic(
             return "- ?"
         item_name = it.get("itemName") or it.get("item") or it.get("name")
         rarity = it.get("rarity")
-        chance = it.get("chance")
-        if isinstance(chance, (int, float)):
-            ch = f"{float(chance):g}%"
-        elif isinstance(chance, str):
-            try:
-                ch = f"{float(chance):g}%"
-            except Exception:
-                ch = "?%"
-        else:
-            ch = "?%"
+        ch = _to_pct(it.get("chance"))
         r = str(rarity).strip() if isinstance(rarity, str) and rarity.strip() else ""
         n = (
             str(item_name).strip()
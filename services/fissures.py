@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from typing import cast
 
-from ..clients.worldstate_client import Platform, WarframeWorldstateClient
+from ..clients.worldstate_client import (
+    FissureInfo,
+    Platform,
+    WarframeWorldstateClient,
+)
 from ..helpers import eta_key_zh
 from ..renderers.worldstate_render import (
     WorldstateRow,
@@ -10,6 +14,18 @@ from ..renderers.worldstate_render import (
 )
 
 
+def _pick_fissures(fissures: list[FissureInfo], fissure_kind: str) -> list[FissureInfo]:
+    """Fissures of the requested kind, soonest to expire first."""
+    if fissure_kind == "九重天":
+        picked = [f for f in fissures if f.is_storm]
+    elif fissure_kind == "钢铁":
+        picked = [f for f in fissures if f.is_hard]
+    else:
+        picked = [f for f in fissures if not f.is_storm and not f.is_hard]
+    picked.sort(key=lambda x: eta_key_zh(x.eta))
+    return picked
+
+
 async def render_fissures_text(
     *,
     worldstate_client: WarframeWorldstateClient,
@@ -24,19 +40,10 @@ async def render_fissures_text(
     if not fissures:
         return f"当前无裂缝（{platform_norm}）。"
 
-    def pick(f):
-        if fissure_kind == "九重天":
-            return f.is_storm
-        if fissure_kind == "钢铁":
-            return f.is_hard
-        return (not f.is_storm) and (not f.is_hard)
-
-    picked = [f for f in fissures if pick(f)]
+    picked = _pick_fissures(fissures, fissure_kind)
     if not picked:
         return f"当前无{fissure_kind}裂缝（{platform_norm}）。"
 
-    picked.sort(key=lambda x: eta_key_zh(x.eta))
-
     lines: list[str] = [f"裂缝（{platform_norm}）{fissure_kind} 共{len(picked)}条："]
     for f in picked:
         enemy = f" | {f.enemy}" if f.enemy else ""
@@ -58,19 +65,10 @@ async def render_fissures_image(
     if not fissures:
         return None
 
-    def pick(f):
-        if fissure_kind == "九重天":
-            return f.is_storm
-        if fissure_kind == "钢铁":
-            return f.is_hard
-        return (not f.is_storm) and (not f.is_hard)
-
-    picked = [f for f in fissures if pick(f)]
+    picked = _pick_fissures(fissures, fissure_kind)
     if not picked:
         return None
 
-    picked.sort(key=lambda x: eta_key_zh(x.eta))
-
     def row_accent(f):
         if f.is_hard:
             return (100, 116, 139, 255)
@@ -9,7 +9,9 @@ from ...components.qq_official_webhook import QQOfficialWebhookPager
 from ...constants import market_status_to_cn
 from ...helpers import uniq_lower
 from .pager_common import (
+    build_wm_pick_state,
     filter_sort_wm_orders,
+    format_wm_order_lines,
     rank_wmr_auctions,
     render_wm_page_image,
     render_wmr_page_image,
@@ -17,12 +19,24 @@ from .pager_common import (
 )
 
 
+_DIRECTION_MAP: dict[str, str] = {
+    "prev": "prev",
+    "previous": "prev",
+    "上一页": "prev",
+    "上": "prev",
+    "up": "prev",
+    "next": "next",
+    "下一页": "next",
+    "下": "next",
+    "down": "next",
+}
+
+
 def parse_direction(text: str) -> str:
     raw = (text or "").strip().lower()
-    if raw in {"prev", "previous", "上一页", "上", "up"}:
-        return "prev"
-    if raw in {"next", "下一页", "下", "down"}:
-        return "next"
+    direction = _DIRECTION_MAP.get(raw)
+    if direction:
+        return direction
     if raw.endswith(":prev"):
         return "prev"
     if raw.endswith(":next"):
@@ -143,15 +157,12 @@ async def cmd_wfp(
 
         wm_pick_cache.put(
             event=event,
-            state={
-                "item_name_en": getattr(item, "name", "") or "",
-                "order_type": order_type,
-                "platform": platform_norm,
-                "rows": [
-                    {"name": (o.ingame_name or "").strip(), "platinum": int(o.platinum)}
-                    for o in top
-                ],
-            },
+            state=build_wm_pick_state(
+                item_name_en=getattr(item, "name", "") or "",
+                order_type=order_type,
+                platform=platform_norm,
+                top=top,
+            ),
         )
 
         if rendered:
@@ -179,12 +190,9 @@ async def cmd_wfp(
 
         action_cn = "收购" if order_type == "buy" else "出售"
         lines = [
-            f"{item.get_localized_name(language)}（{platform_norm}）{action_cn} 第{new_page}页："
+            f"{item.get_localized_name(language)}（{platform_norm}）{action_cn} 第{new_page}页：",
+            *format_wm_order_lines(top),
         ]
-        for idx, o in enumerate(top, start=1):
-            status = market_status_to_cn(o.status)
-            name = o.ingame_name or "unknown"
-            lines.append(f"{idx}. {o.platinum}p  {status}  {name}")
         yield event.plain_result("\n".join(lines))
         if qq_pager.enabled_for(event):
             await qq_pager.send_pager_keyboard(
@@ -204,16 +212,9 @@ async def cmd_wfp(
         platform_norm = str(state.get("platform") or "pc")
         language = str(state.get("language") or "zh")
         weapon_query = str(state.get("weapon_query") or "")
-        positive_stats = [
-            str(x).strip()
-            for x in (state.get("positive_stats") or [])
-            if str(x).strip()
-        ]
-        negative_stats = [
-            str(x).strip()
-            for x in (state.get("negative_stats") or [])
-            if str(x).strip()
-        ]
+        # Normalize once; the fetch, the ranker and the summary share these.
+        positive_stats = uniq_lower(state.get("positive_stats") or [])
+        negative_stats = uniq_lower(state.get("negative_stats") or [])
         negative_required = bool(state.get("negative_required") or False)
         negative_forbidden = bool(state.get("negative_forbidden") or False)
 
@@ -232,6 +233,7 @@ async def cmd_wfp(
                 re_rolls = int(re_rolls)
             except Exception:
                 re_rolls = None
+        summary_cached = state.get("summary")
         attr_units_raw = state.get("riven_attr_units")
         attr_units = (
             {
@@ -278,8 +280,8 @@ async def cmd_wfp(
             auctions_ranked=ranked,
             platform=platform_norm,
             language=language,
-            positive_stats=uniq_lower(positive_stats),
-            negative_stats=uniq_lower(negative_stats),
+            positive_stats=positive_stats,
+            negative_stats=negative_stats,
             negative_required=negative_required,
             negative_forbidden=negative_forbidden,
             mastery_rank_min=mastery_rank_min,
@@ -288,6 +290,7 @@ async def cmd_wfp(
             limit=limit,
             attr_units=attr_units,
             re_rolls=re_rolls,
+            summary=summary_cached if isinstance(summary_cached, str) else None,
         )
 
         if not top:
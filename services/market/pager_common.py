@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from dataclasses import dataclass
+from operator import itemgetter
 from typing import TypeVar
 
 from ...clients.market_client import MarketOrder, RivenAuction
-from ...constants import RIVEN_POLARITY_CN, RIVEN_STAT_CN
+from ...constants import RIVEN_POLARITY_CN, RIVEN_STAT_CN, market_status_to_cn
 from ...helpers import presence_rank, uniq_lower
 from ...mappers.riven_mapping import RivenWeapon
 from ...mappers.term_mapping import MarketItem
@@ -40,38 +42,73 @@ def filter_sort_wm_orders(
     platform_norm = (platform or "pc").strip().lower()
     order_type_norm = (order_type or "sell").strip().lower()
 
-    filtered = [
-        o
-        for o in orders
-        if o.visible
-        and o.order_type == order_type_norm
-        and (o.platform or "").strip().lower() == platform_norm
-    ]
+    # One pass filters by visibility/type/platform and tracks the top mod rank
+    # needed by the "max" level filter.
+    filtered: list[MarketOrder] = []
+    max_rank: int | None = None
+    for o in orders:
+        if not o.visible or o.order_type != order_type_norm:
+            continue
+        if (o.platform or "").strip().lower() != platform_norm:
+            continue
+        filtered.append(o)
+        if o.mod_rank is not None and (max_rank is None or o.mod_rank > max_rank):
+            max_rank = o.mod_rank
 
     # Apply mod_rank (level) filtering.
     if mod_rank is not None and mod_rank != "":
         if mod_rank == "max":
-            # Compute the max mod_rank among filtered orders that have a mod_rank.
-            max_rank: int | None = None
-            for o in filtered:
-                if o.mod_rank is not None:
-                    if max_rank is None or o.mod_rank > max_rank:
-                        max_rank = o.mod_rank
             if max_rank is not None:
                 filtered = [o for o in filtered if o.mod_rank == max_rank]
         elif isinstance(mod_rank, int):
             filtered = [o for o in filtered if o.mod_rank == mod_rank]
 
+    # platinum is validated as int by the market client.
     filtered.sort(
         key=lambda o: (
             presence_rank(o.status),
-            int(o.platinum),
+            o.platinum,
             (o.ingame_name or ""),
         ),
     )
     return filtered
 
 
+@dataclass(frozen=True, slots=True)
+class WMPickRow:
+    name: str
+    platinum: int
+
+
+def build_wm_pick_state(
+    *,
+    item_name_en: str,
+    order_type: str,
+    platform: str,
+    top: list[MarketOrder],
+) -> dict[str, object]:
+    """State consumed by the wm_pick handler for the orders shown on a page."""
+    return {
+        "item_name_en": item_name_en,
+        "order_type": order_type,
+        "platform": platform,
+        "rows": [
+            WMPickRow(name=(o.ingame_name or "").strip(), platinum=int(o.platinum))
+            for o in top
+        ],
+    }
+
+
+def format_wm_order_lines(top: list[MarketOrder]) -> list[str]:
+    """Plain-text rows used when the order image could not be rendered."""
+    lines: list[str] = []
+    for idx, o in enumerate(top, start=1):
+        status = market_status_to_cn(o.status)
+        name = o.ingame_name or "unknown"
+        lines.append(f"{idx}. {o.platinum}p  {status}  {name}")
+    return lines
+
+
 async def render_wm_page_image(
     *,
     item: MarketItem,
@@ -98,9 +135,19 @@ async def render_wm_page_image(
     return rendered, top
 
 
+def _split_attr_names(a: RivenAuction) -> tuple[set[str], set[str]]:
+    a_pos: set[str] = set()
+    a_neg: set[str] = set()
+    for x in a.attributes:
+        (a_pos if x.positive else a_neg).add(x.url_name)
+    return a_pos, a_neg
+
+
 def _wmr_fit_score(
     a: RivenAuction,
     *,
+    a_pos: set[str],
+    a_neg: set[str],
     req_pos: set[str],
     req_neg: set[str],
     negative_required: bool,
@@ -108,14 +155,12 @@ def _wmr_fit_score(
     mastery_rank_min: int | None,
     polarity: str | None,
 ) -> int:
-    a_pos = {x.url_name for x in a.attributes if x.positive}
-    a_neg = {x.url_name for x in a.attributes if not x.positive}
+    # Only counts matter, so derive the differences from one intersection each.
+    hit_pos = len(req_pos & a_pos)
+    hit_neg = len(req_neg & a_neg)
 
-    score = 0
-    score += 10 * len(req_pos & a_pos)
-    score += 10 * len(req_neg & a_neg)
-    score -= 50 * len(req_pos - a_pos)
-    score -= 50 * len(req_neg - a_neg)
+    score = 10 * (hit_pos + hit_neg)
+    score -= 50 * ((len(req_pos) - hit_pos) + (len(req_neg) - hit_neg))
 
     if negative_required and not a_neg:
         score -= 20
@@ -123,9 +168,9 @@ def _wmr_fit_score(
         score -= 20
 
     if req_pos:
-        score -= len(a_pos - req_pos)
+        score -= len(a_pos) - hit_pos
     if req_neg:
-        score -= len(a_neg - req_neg)
+        score -= len(a_neg) - hit_neg
 
     if polarity:
         if (a.polarity or "").strip().lower() == str(polarity).strip().lower():
@@ -174,17 +219,27 @@ def rank_wmr_auctions(
     req_pos = set(uniq_lower(positive_stats))
     req_neg = set(uniq_lower(negative_stats))
 
+    # Split each auction's attributes once; the filters and the scorer share it.
+    with_attrs = [(a, *_split_attr_names(a)) for a in filtered]
+
     if negative_forbidden:
-        filtered = [
-            a for a in filtered if not any((not x.positive) for x in a.attributes)
-        ]
+        with_attrs = [t for t in with_attrs if not t[2]]
     elif negative_required and not req_neg:
-        filtered = [a for a in filtered if any((not x.positive) for x in a.attributes)]
+        with_attrs = [t for t in with_attrs if t[2]]
+
+    # Only a handful of distinct statuses exist; rank each of them once.
+    rank_by_status = {
+        s: presence_rank(s) for s in {t[0].owner_status for t in with_attrs}
+    }
 
-    scored: list[tuple[int, RivenAuction]] = [
+    # Build the full sort key next to the score so sorting is a plain tuple
+    # comparison; the auction itself rides along as the last element.
+    decorated: list[tuple[int, int, int, str, RivenAuction]] = [
         (
-            _wmr_fit_score(
+            -_wmr_fit_score(
                 a,
+                a_pos=a_pos,
+                a_neg=a_neg,
                 req_pos=req_pos,
                 req_neg=req_neg,
                 negative_required=bool(negative_required),
@@ -192,32 +247,24 @@ def rank_wmr_auctions(
                 mastery_rank_min=mastery_rank_min,
                 polarity=polarity,
             ),
+            int(a.buyout_price or 0),
+            rank_by_status[a.owner_status],
+            a.auction_id or "",
             a,
         )
-        for a in filtered
+        for a, a_pos, a_neg in with_attrs
     ]
+    decorated.sort(key=itemgetter(0, 1, 2, 3))
 
-    scored.sort(
-        key=lambda x: (
-            -int(x[0]),
-            int(x[1].buyout_price or 0),
-            presence_rank(x[1].owner_status),
-            (x[1].auction_id or ""),
-        ),
-    )
+    return [t[4] for t in decorated]
 
-    return [a for _, a in scored]
 
 def resort_wmr_auctions_by_presence(
     auctions: list[RivenAuction],
 ) -> list[RivenAuction]:
     """Stable resort: put ingame/online sellers first without breaking prior rank order within same status tier."""
-    return sorted(
-        list(auctions),
-        key=lambda a: (
-            presence_rank(a.owner_status),
-        ),
-    )
+    rank_by_status = {s: presence_rank(s) for s in {a.owner_status for a in auctions}}
+    return sorted(auctions, key=lambda a: rank_by_status[a.owner_status])
 
 
 def build_wmr_summary(
@@ -272,20 +319,22 @@ async def render_wmr_page_image(
     limit: int,
     attr_units: dict[str, str] | None = None,
     re_rolls: int | None = None,
+    summary: str | None = None,
 ) -> tuple[WMRRenderedImage | None, list[RivenAuction], str]:
     picked = pick_page(auctions_ranked, page=page, limit=limit)
     if not picked:
         return None, [], ""
 
-    summary = build_wmr_summary(
-        positive_stats=positive_stats,
-        negative_stats=negative_stats,
-        negative_required=negative_required,
-        negative_forbidden=negative_forbidden,
-        mastery_rank_min=mastery_rank_min,
-        polarity=polarity,
-        re_rolls=re_rolls,
-    )
+    if summary is None:
+        summary = build_wmr_summary(
+            positive_stats=positive_stats,
+            negative_stats=negative_stats,
+            negative_required=negative_required,
+            negative_forbidden=negative_forbidden,
+            mastery_rank_min=mastery_rank_min,
+            polarity=polarity,
+            re_rolls=re_rolls,
+        )
 
     rendered = await render_wmr_auctions_image_to_file(
         weapon=weapon,
@@ -8,11 +8,20 @@ from astrbot.api.event import AstrMessageEvent
 from ...clients.market_client import WarframeMarketClient
 from ...components.event_ttl_cache import EventScopedTTLCache
 from ...components.qq_official_webhook import QQOfficialWebhookPager
-from ...constants import MARKET_PLATFORM_ALIASES, WM_BUY_ALIASES, WM_SELL_ALIASES
-from ...constants import market_status_to_cn
+from ...constants import (
+    MARKET_PLATFORM_ALIASES,
+    MARKET_PLATFORM_VALUES,
+    WM_BUY_ALIASES,
+    WM_SELL_ALIASES,
+)
 from ...helpers import split_tokens
 from ...mappers.term_mapping import WarframeTermMapper
-from .pager_common import filter_sort_wm_orders, render_wm_page_image
+from .pager_common import (
+    build_wm_pick_state,
+    filter_sort_wm_orders,
+    format_wm_order_lines,
+    render_wm_page_image,
+)
 
 # Chinese numeral to integer mapping for level parsing.
 _CN_NUM_SINGLE: dict[str, int] = {
@@ -23,6 +32,9 @@ _CN_NUM_SINGLE: dict[str, int] = {
 # Patterns to detect level tokens.
 _LEVEL_KEYWORDS: set[str] = {"满级", "满等", "满", "max"}
 _LEVEL_SUFFIX_PATTERN = re.compile(r"^(.*?)\s*[级等]$")
+_LEVEL_PREFIXES: tuple[str, ...] = ("满级", "满等", "满", "max")
+_QUERY_LEVEL_SUFFIX_PATTERN = re.compile(r"^(.*?)(\d+)\s*[级等]$")
+_LANG_PATTERN = re.compile(r"[a-z]{2}([\-_][a-z]{2,8})?")
 
 
 def _parse_level_token(token: str) -> int | str | None:
@@ -114,7 +126,6 @@ async def cmd_wm(
     mod_rank_level: int | str | None = None  # int=特定等级, "max"=满级
 
     # Detect level keyword embedded in query token (e.g. "满级xxx", "xxx五级").
-    _LEVEL_PREFIXES = ("满级", "满等", "满", "max")
     for prefix in _LEVEL_PREFIXES:
         if query.startswith(prefix) and len(query) > len(prefix):
             mod_rank_level = "max"
@@ -128,7 +139,7 @@ async def cmd_wm(
                 break
     # Also check query suffix for "X级" / "X等" pattern (e.g. "xxx5级").
     if mod_rank_level is None:
-        m_sfx = re.match(r"^(.*?)(\d+)\s*[级等]$", query)
+        m_sfx = _QUERY_LEVEL_SUFFIX_PATTERN.match(query)
         if m_sfx:
             query = m_sfx.group(1)
             mod_rank_level = int(m_sfx.group(2))
@@ -140,7 +151,7 @@ async def cmd_wm(
         if t_norm in MARKET_PLATFORM_ALIASES:
             platform_norm = MARKET_PLATFORM_ALIASES[t_norm]
             continue
-        if t_norm in MARKET_PLATFORM_ALIASES.values():
+        if t_norm in MARKET_PLATFORM_VALUES:
             platform_norm = t_norm
             continue
         if t_norm in WM_BUY_ALIASES:
@@ -159,7 +170,7 @@ async def cmd_wm(
         if t_norm.isdigit():
             limit = int(t_norm)
             continue
-        if re.fullmatch(r"[a-z]{2}([\-_][a-z]{2,8})?", t_norm):
+        if _LANG_PATTERN.fullmatch(t_norm):
             language = t_norm.replace("_", "-")
             continue
 
@@ -232,15 +243,12 @@ async def cmd_wm(
 
     wm_pick_cache.put(
         event=event,
-        state={
-            "item_name_en": item.name,
-            "order_type": order_type,
-            "platform": platform_norm,
-            "rows": [
-                {"name": (o.ingame_name or "").strip(), "platinum": int(o.platinum)}
-                for o in top
-            ],
-        },
+        state=build_wm_pick_state(
+            item_name_en=item.name,
+            order_type=order_type,
+            platform=platform_norm,
+            top=top,
+        ),
     )
 
     if rendered:
@@ -267,12 +275,9 @@ async def cmd_wm(
         return
 
     lines = [
-        f"{item.get_localized_name(language)}（{platform_norm}）{action_cn} 低->高 前{len(top)}："
+        f"{item.get_localized_name(language)}（{platform_norm}）{action_cn} 低->高 前{len(top)}：",
+        *format_wm_order_lines(top),
     ]
-    for idx, o in enumerate(top, start=1):
-        status = market_status_to_cn(o.status)
-        name = o.ingame_name or "unknown"
-        lines.append(f"{idx}. {o.platinum}p  {status}  {name}")
     yield event.plain_result("\n".join(lines))
 
     if qq_pager.enabled_for(event):
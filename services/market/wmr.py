@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import re
 
 from astrbot.api import logger
@@ -8,12 +9,13 @@ from astrbot.api.event import AstrMessageEvent
 from ...clients.market_client import WarframeMarketClient
 from ...components.event_ttl_cache import EventScopedTTLCache
 from ...components.qq_official_webhook import QQOfficialWebhookPager
-from ...constants import MARKET_PLATFORM_ALIASES
+from ...constants import MARKET_PLATFORM_ALIASES, MARKET_PLATFORM_VALUES
 from ...constants import market_status_to_cn
 from ...helpers import split_tokens, uniq_lower
 from ...mappers.riven_mapping import RivenWeapon, WarframeRivenWeaponMapper
 from ...mappers.riven_stats_mapping import WarframeRivenStatMapper
 from .pager_common import (
+    build_wmr_summary,
     rank_wmr_auctions,
     render_wmr_page_image,
     resort_wmr_auctions_by_presence,
@@ -27,9 +29,36 @@ _WMR_USAGE_TEXT = (
     "说明：负任意=必须有任意负词条；无负=不能有负词条。"
 )
 
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_LANG_PATTERN = re.compile(r"[a-z]{2}([\-_][a-z]{2,8})?")
+_MR_PATTERN = re.compile(r"mr?(\d{1,2})")
+_MR_DUAN_PATTERN = re.compile(r"(\d{1,2})段")
+_POLARITY_PATTERN = re.compile(r"([vd\-r])槽|([vd\-r])极性|极性([vd\-r])")
+_POLARITY_BY_SYMBOL = {
+    "v": "madurai",
+    "d": "vazarin",
+    "-": "naramon",
+    "r": "zenurik",
+}
+_REROLL_PATTERN = re.compile(r"(\d{1,3})\s*洗")
+_REROLL_EN_PATTERN = re.compile(r"(\d{1,3})\s*roll")
+
+# Whole-token filters resolved with a single lookup: token -> (kind, value).
+# Platform entries come last so they win over any overlapping keyword.
+_WMR_EXACT_TOKENS: dict[str, tuple[str, str]] = {
+    **dict.fromkeys(
+        ("零洗", "0洗", "零roll", "0roll", "零循环", "0循环"), ("zero_roll", "")
+    ),
+    **dict.fromkeys(("负任意", "任意负", "有负", "要负"), ("negative_any", "")),
+    **dict.fromkeys(("无负", "不要负", "不带负"), ("negative_none", "")),
+    **{p: ("polarity", p) for p in _POLARITY_BY_SYMBOL.values()},
+    **{p: ("platform", p) for p in MARKET_PLATFORM_VALUES},
+    **{k: ("platform", v) for k, v in MARKET_PLATFORM_ALIASES.items()},
+}
+
 
 def _normalize_key(text: str) -> str:
-    return re.sub(r"\s+", "", str(text or "").strip().lower())
+    return _WHITESPACE_PATTERN.sub("", str(text or "").strip().lower())
 
 
 def _is_wmr_control_token(token_norm: str) -> bool:
@@ -37,32 +66,20 @@ def _is_wmr_control_token(token_norm: str) -> bool:
     if not t:
         return True
 
-    if t in MARKET_PLATFORM_ALIASES or t in MARKET_PLATFORM_ALIASES.values():
+    if t in _WMR_EXACT_TOKENS:
         return True
     if t.isdigit():
         return True
 
-    if re.fullmatch(r"mr?(\d{1,2})", t):
-        return True
-    if re.fullmatch(r"(\d{1,2})段", t):
-        return True
-
-    if re.fullmatch(r"([vd\-r])槽", t):
-        return True
-    if re.fullmatch(r"([vd\-r])极性", t):
-        return True
-    if re.fullmatch(r"极性([vd\-r])", t):
+    if _MR_PATTERN.fullmatch(t):
         return True
-    if t in {"madurai", "vazarin", "naramon", "zenurik"}:
+    if _MR_DUAN_PATTERN.fullmatch(t):
         return True
 
-    if t in {"负任意", "任意负", "有负", "要负", "无负", "不要负", "不带负"}:
+    if _POLARITY_PATTERN.fullmatch(t):
         return True
     if "双暴" in t or "双爆" in t:
         return True
-    # Zero-roll keywords.
-    if t in {"零洗", "0洗", "零roll", "0roll", "零循环", "0循环"}:
-        return True
 
     return False
 
@@ -153,9 +170,13 @@ async def cmd_wmr(
     weapon: RivenWeapon | None = None
     rest = tokens[1:]
 
-    extracted_weapon = await _extract_weapon_and_rest_tokens(
-        tokens=tokens,
-        riven_weapon_mapper=riven_weapon_mapper,
+    # Both mappers may load their caches from disk or the API on first use.
+    extracted_weapon, _ = await asyncio.gather(
+        _extract_weapon_and_rest_tokens(
+            tokens=tokens,
+            riven_weapon_mapper=riven_weapon_mapper,
+        ),
+        riven_stat_mapper.initialize(),
     )
     if extracted_weapon is not None:
         weapon_query, weapon, rest = extracted_weapon
@@ -176,56 +197,50 @@ async def cmd_wmr(
     unknown_tokens: list[str] = []
     unresolved_stat_tokens: list[str] = []
 
-    await riven_stat_mapper.initialize()
-
     for t in rest:
         t_norm = _normalize_key(t)
         if not t_norm:
             continue
 
-        if t_norm in MARKET_PLATFORM_ALIASES:
-            platform_norm = MARKET_PLATFORM_ALIASES[t_norm]
-            continue
-        if t_norm in MARKET_PLATFORM_ALIASES.values():
-            platform_norm = t_norm
+        exact = _WMR_EXACT_TOKENS.get(t_norm)
+        if exact is not None:
+            kind, value = exact
+            if kind == "platform":
+                platform_norm = value
+            elif kind == "polarity":
+                polarity = value
+            elif kind == "zero_roll":
+                re_rolls = 0
+            elif kind == "negative_any":
+                negative_required = True
+                negative_forbidden = False
+            else:
+                negative_required = False
+                negative_forbidden = True
+                negative_stats = []
             continue
 
         if t_norm.isdigit():
             limit = int(t_norm)
             continue
 
-        if re.fullmatch(r"[a-z]{2}([\-_][a-z]{2,8})?", t_norm):
+        if _LANG_PATTERN.fullmatch(t_norm):
             language = t_norm.replace("_", "-")
             continue
 
-        m = re.fullmatch(r"mr?(\d{1,2})", t_norm)
+        m = _MR_PATTERN.fullmatch(t_norm)
         if m:
             mastery_rank_min = int(m.group(1))
             continue
-        m = re.fullmatch(r"(\d{1,2})段", t_norm)
+        m = _MR_DUAN_PATTERN.fullmatch(t_norm)
         if m:
             mastery_rank_min = int(m.group(1))
             continue
 
-        m = re.fullmatch(r"([vd\-r])槽", t_norm)
-        if not m:
-            m = re.fullmatch(r"([vd\-r])极性", t_norm)
-        if not m:
-            m = re.fullmatch(r"极性([vd\-r])", t_norm)
+        m = _POLARITY_PATTERN.fullmatch(t_norm)
         if m:
-            p = m.group(1)
-            if p == "v":
-                polarity = "madurai"
-            elif p == "d":
-                polarity = "vazarin"
-            elif p == "-":
-                polarity = "naramon"
-            elif p == "r":
-                polarity = "zenurik"
-            continue
-
-        if t_norm in {"madurai", "vazarin", "naramon", "zenurik"}:
-            polarity = t_norm
+            symbol = m.group(1) or m.group(2) or m.group(3)
+            polarity = _POLARITY_BY_SYMBOL[symbol]
             continue
 
         if "双暴" in t_norm or "双爆" in t_norm:
@@ -265,29 +280,20 @@ async def cmd_wmr(
                 positive_stats.append("channeling_damage")
             continue
 
-        # Zero-roll filter: "零洗", "0洗", etc.
-        if t_norm in {"零洗", "0洗", "零roll", "0roll", "零循环", "0循环"}:
-            re_rolls = 0
-            continue
         # Numeric roll filter: "N洗" e.g. "5洗" -> re_rolls=5
-        m_roll = re.fullmatch(r"(\d{1,3})\s*洗", t_norm)
+        m_roll = _REROLL_PATTERN.fullmatch(t_norm)
         if m_roll:
             re_rolls = int(m_roll.group(1))
             continue
-        m_roll = re.fullmatch(r"(\d{1,3})\s*roll", t_norm)
+        m_roll = _REROLL_EN_PATTERN.fullmatch(t_norm)
         if m_roll:
             re_rolls = int(m_roll.group(1))
             continue
 
-        if t_norm in {"负任意", "任意负", "有负", "要负"} or "负任意" in t_norm:
+        if "负任意" in t_norm:
             negative_required = True
             negative_forbidden = False
             continue
-        if t_norm in {"无负", "不要负", "不带负"}:
-            negative_required = False
-            negative_forbidden = True
-            negative_stats = []
-            continue
         if t_norm.startswith("负") and len(t_norm) > 1:
             negative_required = True
             negative_forbidden = False
@@ -468,6 +474,16 @@ async def cmd_wmr(
         yield event.plain_result("没有符合条件的一口价紫卡拍卖。")
         return
 
+    summary = build_wmr_summary(
+        positive_stats=positive_stats,
+        negative_stats=negative_stats,
+        negative_required=bool(negative_required),
+        negative_forbidden=bool(negative_forbidden),
+        mastery_rank_min=mastery_rank_min,
+        polarity=polarity,
+        re_rolls=re_rolls,
+    )
+
     pager_cache.put(
         event=event,
         state={
@@ -486,6 +502,7 @@ async def cmd_wmr(
             "polarity": polarity,
             "re_rolls": re_rolls,
             "riven_attr_units": dict(attr_units),
+            "summary": summary,
             "reply_msg_id": str(
                 getattr(getattr(event, "message_obj", None), "message_id", None) or ""
             ),
@@ -508,6 +525,7 @@ async def cmd_wmr(
         limit=limit,
         attr_units=attr_units,
         re_rolls=re_rolls,
+        summary=summary,
     )
 
     if not top:
@@ -9,7 +9,7 @@ from ..clients.worldstate_client import (
     SyndicateJob,
     WarframeWorldstateClient,
 )
-from ..constants import WORLDSTATE_PLATFORM_ALIASES
+from ..constants import WORLDSTATE_PLATFORM_ALIASES, WORLDSTATE_PLATFORM_VALUES
 from ..helpers import split_tokens
 from ..renderers.worldstate_render import (
     WorldstateRow,
@@ -1161,10 +1161,7 @@ async def cmd_syndicates(
 
     def is_platform_token(tok: str) -> bool:
         t = (tok or "").strip().lower()
-        return (
-            t in WORLDSTATE_PLATFORM_ALIASES
-            or t in WORLDSTATE_PLATFORM_ALIASES.values()
-        )
+        return t in WORLDSTATE_PLATFORM_ALIASES or t in WORLDSTATE_PLATFORM_VALUES
 
     name_tokens: list[str] = []
     for t in tokens: